@@ -1,6 +1,226 @@
 import json
+import os
+import sys
+import tempfile
+from array import array
 from collections import deque
 
+# Serialización JSON: se usa orjson si está instalado (mucho más rápido) y, si no, el
+# módulo json estándar. La elección se hace una sola vez, al importar el módulo.
+# En PyPy se usa siempre json: orjson solo funciona allí a través de la capa de
+# compatibilidad con extensiones de C (cpyext), que es más lenta que el propio json.
+if hasattr(sys, "pypy_version_info"):
+    orjson = None
+else:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+if orjson is not None:
+    def _a_json(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _desde_json = orjson.loads
+else:
+    # Mismo formato que orjson (sangría de 2 y UTF-8 sin escapar), para que el archivo
+    # guardado no dependa de qué librería está instalada.
+    def _a_json(data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    _desde_json = json.loads
+
+# Códigos de terminación del recorrido (ver _crear_recorrido).
+_FIN = 0
+_SIMBOLO_INVALIDO = 1
+_SIN_TRANSICION = 2
+
+# Los caracteres que no pertenecen al alfabeto se codifican con el índice `num_simbolos`
+# (una columna más allá de la última), que nunca coincide con un símbolo real.
+
+
+class _IdsSimbolos(dict):
+    """
+    Diccionario de símbolo a índice de columna que devuelve el tamaño del alfabeto
+    (un índice fuera de la tabla) para símbolos que no pertenecen a él.
+    """
+    def __missing__(self, simbolo):
+        return len(self)
+
+
+def _validar_cadenas(elementos, descripcion):
+    """
+    Comprueba que todos los elementos sean cadenas de texto.
+
+    Recorre los elementos en un único bucle y se detiene en el primero inválido.
+
+    Args:
+        elementos (list): Los elementos a comprobar.
+        descripcion (str): El sujeto del mensaje de error (ej. "Los estados").
+
+    Raises:
+        TypeError: Si algún elemento no es exactamente de tipo `str`.
+    """
+    for elemento in elementos:
+        if type(elemento) is not str:
+            raise TypeError(f"{descripcion} deben ser cadenas de texto.")
+
+
+def _crear_recorrido(tabla, num_simbolos):
+    """
+    Especializa el núcleo de la simulación para una tabla de transiciones concreta.
+
+    Devuelve una función que recorre la tabla con los símbolos de una cadena. La tabla,
+    su ancho y los códigos de terminación quedan ligados a la función (clausura), por
+    lo que el bucle interno solo trabaja con variables locales, sin accesos a atributos
+    ni a variables globales. El historial no se registra; se reconstruye aparte solo
+    cuando hace falta.
+
+    Args:
+        tabla (list[int]): Tabla plana de transiciones (ver AutomataAFD._compilar_tabla).
+        num_simbolos (int): Tamaño del alfabeto (ancho de cada fila de la tabla).
+
+    Returns:
+        function: Una función `recorrer(estado, simbolos)` donde `estado` es el índice
+                  del estado de partida y `simbolos` la secuencia de índices de símbolo
+                  de la cadena (con `num_simbolos` para los caracteres ajenos al alfabeto).
+                  Devuelve una tupla (estado, posicion, codigo) con el último estado
+                  alcanzado, el número de símbolos consumidos y uno de los códigos _FIN,
+                  _SIMBOLO_INVALIDO o _SIN_TRANSICION.
+    """
+    fin, simbolo_invalido, sin_transicion = _FIN, _SIMBOLO_INVALIDO, _SIN_TRANSICION
+    desconocido = num_simbolos
+
+    def recorrer(estado, simbolos):
+        for posicion, s in enumerate(simbolos):
+            if s == desconocido:
+                return estado, posicion, simbolo_invalido
+            siguiente = tabla[estado * num_simbolos + s]
+            if siguiente < 0:
+                return estado, posicion, sin_transicion
+            estado = siguiente
+        return estado, len(simbolos), fin
+
+    return recorrer
+
+
+def _minimizar(tabla, num_simbolos, inicial, aceptacion):
+    """
+    Minimiza un AFD representado con la tabla densa, conservando su lenguaje.
+
+    Descarta los estados inalcanzables y fusiona los estados equivalentes mediante
+    refinamiento de particiones (algoritmo de Hopcroft). Las transiciones no definidas se
+    tratan como un estado sumidero explícito; todos los estados equivalentes a ese
+    sumidero (los que ya no pueden llevar a aceptación) desaparecen del resultado y sus
+    transiciones quedan marcadas con -1.
+
+    Args:
+        tabla (list[int]): Tabla plana de transiciones (ver AutomataAFD._compilar_tabla).
+        num_simbolos (int): Tamaño del alfabeto (ancho de cada fila de la tabla).
+        inicial (int): Índice del estado inicial.
+        aceptacion (bytearray): Mapa de aceptación indexado por estado.
+
+    Returns:
+        tuple: Una tupla (tabla, inicial, aceptacion) con la misma estructura que los
+               argumentos, para el autómata mínimo. El estado inicial siempre es el 0.
+    """
+    # 1. Estados alcanzables desde el inicial, en orden de búsqueda en anchura.
+    alcanzables = [inicial]
+    vistos = {inicial}
+    for estado in alcanzables:
+        for destino in tabla[estado * num_simbolos:(estado + 1) * num_simbolos]:
+            if destino >= 0 and destino not in vistos:
+                vistos.add(destino)
+                alcanzables.append(destino)
+
+    # 2. Filas reindexadas sobre los alcanzables, con el sumidero como último estado.
+    sumidero = len(alcanzables)
+    indice = {estado: i for i, estado in enumerate(alcanzables)}
+    filas = [
+        [indice[destino] if destino >= 0 else sumidero
+         for destino in tabla[estado * num_simbolos:(estado + 1) * num_simbolos]]
+        for estado in alcanzables
+    ]
+    filas.append([sumidero] * num_simbolos)
+
+    # 3. Refinamiento (algoritmo de Hopcroft): se parte de {aceptación, no aceptación}
+    #    y, para cada par (bloque, símbolo) pendiente, se separan de cada bloque los
+    #    estados que con ese símbolo entran al bloque de los que no. Al dividir un bloque
+    #    solo se reetiqueta y se encola la mitad menor, lo que da O(n·|Σ|·log n).
+    total = sumidero + 1
+    predecesores = [[[] for _ in range(total)] for _ in range(num_simbolos)]
+    for origen, fila in enumerate(filas):
+        for s, destino in enumerate(fila):
+            predecesores[s][destino].append(origen)
+
+    clase = [aceptacion[estado] for estado in alcanzables] + [0]
+    bloques = [set(), set()]
+    for estado, c in enumerate(clase):
+        bloques[c].add(estado)
+    if not bloques[1]:
+        # Ningún estado alcanzable es de aceptación: el lenguaje es vacío.
+        return [-1] * num_simbolos, 0, bytearray(1)
+
+    menor = 0 if len(bloques[0]) <= len(bloques[1]) else 1
+    pendientes = [(menor, s) for s in range(num_simbolos)]
+    en_pendientes = set(pendientes)
+    while pendientes:
+        bloque, s = pendientes.pop()
+        en_pendientes.discard((bloque, s))
+        entrantes = predecesores[s]
+        afectados = {}
+        for destino in bloques[bloque]:
+            for origen in entrantes[destino]:
+                afectados.setdefault(clase[origen], []).append(origen)
+
+        for c, miembros in afectados.items():
+            actual = bloques[c]
+            if len(miembros) == len(actual):
+                continue
+            # El bloque nuevo es siempre la parte menor de la división.
+            if 2 * len(miembros) <= len(actual):
+                separados = set(miembros)
+            else:
+                separados = actual.difference(miembros)
+            actual -= separados
+            nuevo = len(bloques)
+            bloques.append(separados)
+            for estado in separados:
+                clase[estado] = nuevo
+            for t in range(num_simbolos):
+                if (c, t) in en_pendientes:
+                    par = (nuevo, t)
+                else:
+                    par = (nuevo if len(separados) <= len(actual) else c, t)
+                if par not in en_pendientes:
+                    en_pendientes.add(par)
+                    pendientes.append(par)
+
+    # 4. Construcción del autómata mínimo sin la clase del sumidero. Las clases se
+    #    numeran por orden de aparición, así que la del estado inicial es la 0.
+    clase_sumidero = clase[sumidero]
+    nuevo_id = {}
+    for c in clase[:sumidero]:
+        if c != clase_sumidero and c not in nuevo_id:
+            nuevo_id[c] = len(nuevo_id)
+    if clase[0] == clase_sumidero:
+        # El lenguaje es vacío: basta un único estado sin transiciones ni aceptación.
+        return [-1] * num_simbolos, 0, bytearray(1)
+
+    tabla_minima = [-1] * (len(nuevo_id) * num_simbolos)
+    aceptacion_minima = bytearray(len(nuevo_id))
+    for i, fila in enumerate(filas[:sumidero]):
+        if clase[i] == clase_sumidero:
+            continue
+        origen = nuevo_id[clase[i]]
+        aceptacion_minima[origen] = aceptacion[alcanzables[i]]
+        base = origen * num_simbolos
+        for s, destino in enumerate(fila):
+            if clase[destino] != clase_sumidero:
+                tabla_minima[base + s] = nuevo_id[clase[destino]]
+    return tabla_minima, 0, aceptacion_minima
+
+
 class AutomataAFD:
     """
     Clase que representa un Autómata Finito Determinista (AFD).
@@ -17,9 +237,30 @@ class AutomataAFD:
         self.alfabeto = set()
         self.transiciones = {}
         self.estado_inicial = None
-        self.estados_aceptacion = set()
+        self.estados_aceptacion = frozenset()
 
-    def definir_automata(self, estados, alfabeto, transiciones, estado_inicial, estados_aceptacion):
+        # `transiciones` conserva el formato {origen: {simbolo: destino}} porque es el que
+        # se guarda en JSON y el que muestra la GUI. La simulación no lo consulta: usa la
+        # representación compacta siguiente (ver _compilar_tabla), donde cada paso es un
+        # único acceso por índice a una lista plana.
+        self._estado_id = {}
+        self._estados_por_id = []
+        self._simbolo_id = _IdsSimbolos()
+        self._simbolos_por_id = []
+        self._traduccion = None
+        self._tabla = []
+        self._recorrer = _crear_recorrido(self._tabla, 0)
+        self._inicial_id = -1
+        self._inicial_acepta = False
+        self._aceptacion = bytearray()
+        # Autómata mínimo equivalente (ver _compilar_tabla); por defecto, el propio original.
+        self._usar_minimo = True
+        self._recorrer_min = self._recorrer
+        self._inicial_min = -1
+        self._aceptacion_min = self._aceptacion
+        self._salidas = []
+
+    def definir_automata(self, estados, alfabeto, transiciones, estado_inicial, estados_aceptacion, minimizar=True):
         """
         Define los cinco componentes de un AFD y realiza validaciones iniciales.
 
@@ -30,34 +271,48 @@ class AutomataAFD:
                                         una transición en el formato (origen, simbolo, destino).
             estado_inicial (str): La cadena que representa el estado inicial.
             estados_aceptacion (list[str]): Una lista de cadenas que representan los estados de aceptación.
+            minimizar (bool): Si es True (por defecto), se calcula además el AFD mínimo
+                              equivalente, que es el que usan acepta, evaluar_lote y
+                              generar_cadenas_lenguaje.
 
         Raises:
             TypeError: Si los componentes no son del tipo esperado (cadenas de texto).
             ValueError: Si hay inconsistencias lógicas (ej. estado inicial no en estados,
                         símbolo '*' en el alfabeto, etc.).
         """
-        if not all(isinstance(e, str) for e in estados):
-            raise TypeError("Los estados deben ser cadenas de texto.")
-        if not all(isinstance(s, str) for s in alfabeto):
-            raise TypeError("Los símbolos del alfabeto deben ser cadenas de texto.")
-        if not isinstance(estado_inicial, str):
+        _validar_cadenas(estados, "Los estados")
+        _validar_cadenas(alfabeto, "Los símbolos del alfabeto")
+        if type(estado_inicial) is not str:
             raise TypeError("El estado inicial debe ser una cadena de texto.")
-        if not all(isinstance(e, str) for e in estados_aceptacion):
-            raise TypeError("Los estados de aceptación deben ser cadenas de texto.")
+        _validar_cadenas(estados_aceptacion, "Los estados de aceptación")
+
+        # Los nombres se internan para que su hash quede cacheado y las comparaciones
+        # entre claves iguales se resuelvan por identidad.
+        estados = [sys.intern(e) for e in estados]
+        alfabeto = [sys.intern(s) for s in alfabeto]
+        estado_inicial = sys.intern(estado_inicial)
+        estados_aceptacion = [sys.intern(e) for e in estados_aceptacion]
 
-        if estado_inicial not in estados:
+        # Cada conjunto se construye una sola vez y se reutiliza en la validación y en la asignación.
+        conjunto_estados = set(estados)
+        conjunto_alfabeto = set(alfabeto)
+        conjunto_aceptacion = frozenset(estados_aceptacion)
+
+        if estado_inicial not in conjunto_estados:
             raise ValueError("El estado inicial debe ser uno de los estados definidos.")
-        if not set(estados_aceptacion).issubset(set(estados)):
+        if not conjunto_aceptacion.issubset(conjunto_estados):
             raise ValueError("Todos los estados de aceptación deben ser parte del conjunto de estados.")
         
-        if '*' in alfabeto:
+        if '*' in conjunto_alfabeto:
             raise ValueError("El símbolo '*' está reservado para la cadena vacía y no puede ser parte del alfabeto.")
 
-        self.estados = set(estados)
-        self.alfabeto = set(alfabeto)
+        self.estados = conjunto_estados
+        self.alfabeto = conjunto_alfabeto
         self.estado_inicial = estado_inicial
-        self.estados_aceptacion = set(estados_aceptacion)
+        self.estados_aceptacion = conjunto_aceptacion
         self.transiciones = self._crear_tabla_transiciones(transiciones)
+        self._usar_minimo = minimizar
+        self._compilar_tabla()
 
     def _crear_tabla_transiciones(self, lista_transiciones):
         """
@@ -77,22 +332,142 @@ class AutomataAFD:
             ValueError: Si un estado o símbolo en una transición no existe, o si se define
                         una transición duplicada para un mismo estado y símbolo.
         """
+        estados = self.estados
+        alfabeto = self.alfabeto
         tabla = {}
         for origen, simbolo, destino in lista_transiciones:
-            if origen not in self.estados:
+            origen, simbolo, destino = sys.intern(origen), sys.intern(simbolo), sys.intern(destino)
+            if origen not in estados:
                 raise ValueError(f"Estado de origen '{origen}' no definido.")
-            if simbolo not in self.alfabeto:
+            if simbolo not in alfabeto:
                 raise ValueError(f"Símbolo de transición '{simbolo}' no definido en el alfabeto.")
-            if destino not in self.estados:
+            if destino not in estados:
                 raise ValueError(f"Estado de destino '{destino}' no definido.")
             
-            if origen not in tabla:
-                tabla[origen] = {}
-            if simbolo in tabla[origen]:
+            fila = tabla.setdefault(origen, {})
+            if simbolo in fila:
                 raise ValueError(f"Transición duplicada para el estado '{origen}' con el símbolo '{simbolo}'.")
-            tabla[origen][simbolo] = destino
+            fila[simbolo] = destino
         return tabla
 
+    def _compilar_tabla(self):
+        """
+        Construye una tabla de transiciones densa indexada por enteros.
+
+        Los estados y los símbolos se numeran en orden lexicográfico y la tabla se
+        almacena como una lista plana en orden por filas, de modo que la transición
+        desde el estado `e` con el símbolo `s` se encuentra en `tabla[e * |Σ| + s]`.
+        Las transiciones no definidas se marcan con -1. Así, cada paso de la simulación
+        cuesta un solo acceso por índice en lugar de dos búsquedas en diccionarios.
+
+        Raises:
+            ValueError: Si una transición hace referencia a un estado o símbolo no definido.
+        """
+        estados_por_id = sorted(self.estados)
+        estado_id = {e: i for i, e in enumerate(estados_por_id)}
+        simbolos_por_id = sorted(self.alfabeto)
+        simbolo_id = _IdsSimbolos((s, i) for i, s in enumerate(simbolos_por_id))
+        num_simbolos = len(simbolo_id)
+
+        tabla = [-1] * (len(estados_por_id) * num_simbolos)
+        for origen, fila in self.transiciones.items():
+            origen_id = estado_id.get(origen, -1)
+            if origen_id < 0:
+                raise ValueError(f"Estado de origen '{origen}' no definido.")
+            base = origen_id * num_simbolos
+            for simbolo, destino in fila.items():
+                s = simbolo_id.get(simbolo, -1)
+                if s < 0:
+                    raise ValueError(f"Símbolo de transición '{simbolo}' no definido en el alfabeto.")
+                destino_id = estado_id.get(destino, -1)
+                if destino_id < 0:
+                    raise ValueError(f"Estado de destino '{destino}' no definido.")
+                tabla[base + s] = destino_id
+
+        self._estado_id = estado_id
+        self._estados_por_id = estados_por_id
+        self._simbolo_id = simbolo_id
+        self._simbolos_por_id = simbolos_por_id
+        self._traduccion = self._crear_traduccion(simbolo_id)
+        self._tabla = tabla
+        self._recorrer = _crear_recorrido(tabla, num_simbolos)
+        self._inicial_id = estado_id.get(self.estado_inicial, -1)
+        if self.estado_inicial is not None and self._inicial_id < 0:
+            raise ValueError("El estado inicial debe ser uno de los estados definidos.")
+        # Mapa de bytes indexado por estado: 1 si el estado es de aceptación.
+        self._aceptacion = bytearray(e in self.estados_aceptacion for e in estados_por_id)
+        self._inicial_acepta = self.estado_inicial in self.estados_aceptacion
+
+        # Versión mínima del autómata (mismo lenguaje, menos estados) para las operaciones
+        # que solo necesitan el veredicto: acepta, evaluar_lote y generar_cadenas_lenguaje.
+        # evaluar_cadena usa siempre la tabla original para mostrar los estados del usuario.
+        if self._usar_minimo and self._inicial_id >= 0:
+            tabla_min, inicial_min, aceptacion_min = _minimizar(tabla, num_simbolos, self._inicial_id, self._aceptacion)
+        else:
+            tabla_min, inicial_min, aceptacion_min = tabla, self._inicial_id, self._aceptacion
+        self._recorrer_min = _crear_recorrido(tabla_min, num_simbolos)
+        self._inicial_min = inicial_min
+        self._aceptacion_min = aceptacion_min
+        # Transiciones salientes (simbolo_id, destino_id) de cada estado para el BFS; al
+        # numerarse los símbolos en orden lexicográfico ya quedan ordenadas por símbolo.
+        self._salidas = [
+            [(s, destino) for s, destino in enumerate(tabla_min[i * num_simbolos:(i + 1) * num_simbolos]) if destino >= 0]
+            for i in range(len(aceptacion_min))
+        ]
+
+    @staticmethod
+    def _crear_traduccion(simbolo_id):
+        """
+        Construye una tabla de 256 bytes para traducir una cadena a índices de símbolo.
+
+        Usada con `bytes.translate`, convierte de una sola vez (en C) cada byte de la
+        cadena codificada en Latin-1 en el índice de su símbolo, o en el tamaño del alfabeto
+        si no pertenece a él. Solo es aplicable cuando todos los símbolos de un carácter
+        caben en un byte (el caso habitual) y los índices, incluido el de "desconocido",
+        caben en un byte; los símbolos de varios caracteres nunca coinciden con un carácter
+        de la entrada, por lo que no afectan a la tabla.
+
+        Args:
+            simbolo_id (dict): Correspondencia de cada símbolo con su índice de columna.
+
+        Returns:
+            bytes or None: La tabla de traducción, o None si no es aplicable.
+        """
+        desconocido = len(simbolo_id)
+        if desconocido > 255:
+            return None
+        traduccion = bytearray([desconocido]) * 256
+        for simbolo, indice in simbolo_id.items():
+            if len(simbolo) != 1:
+                continue
+            codigo = ord(simbolo)
+            if codigo >= 256:
+                return None
+            traduccion[codigo] = indice
+        return bytes(traduccion)
+
+    def _codificar(self, cadena):
+        """
+        Traduce una cadena a la secuencia de índices de símbolo que recorre `self._recorrer`.
+
+        Si existe la tabla de traducción y la cadena se puede codificar en Latin-1 (un
+        byte por carácter, por lo que las posiciones coinciden), la traducción completa
+        se hace con `bytes.translate`; en otro caso se consulta el diccionario de
+        símbolos carácter a carácter.
+
+        Args:
+            cadena (str): La cadena a evaluar.
+
+        Returns:
+            bytes or list[int]: Los índices de símbolo de cada carácter de la cadena.
+        """
+        if self._traduccion is not None:
+            try:
+                return cadena.encode('latin-1').translate(self._traduccion)
+            except UnicodeEncodeError:
+                pass
+        return list(map(self._simbolo_id.__getitem__, cadena))
+
     def evaluar_cadena(self, cadena):
         """
         Procesa una cadena de entrada y determina si es aceptada por el AFD.
@@ -109,28 +484,188 @@ class AutomataAFD:
                    - str: Un mensaje descriptivo del resultado o del error encontrado.
         """
         if cadena == '*':
-            if self.estado_inicial in self.estados_aceptacion:
-                return "ACEPTADA", [(self.estado_inicial, None)], "La cadena vacía es aceptada porque el estado inicial es de aceptación."
-            else:
-                return "RECHAZADA", [(self.estado_inicial, None)], "La cadena vacía es rechazada porque el estado inicial no es de aceptación."
+            aceptada, mensaje = self._resultado_cadena_vacia()
+            return ("ACEPTADA" if aceptada else "RECHAZADA"), [(self.estado_inicial, None)], mensaje
         
-        estado_actual = self.estado_inicial
-        historial_recorrido = [(estado_actual, None)]
+        simbolos = self._codificar(cadena)
+        estado, posicion, codigo = self._recorrer(self._inicial_id, simbolos)
+        historial_recorrido = self._reconstruir_historial(simbolos, posicion)
+        aceptada, mensaje = self._resultado_recorrido(cadena, estado, posicion, codigo)
+        return ("ACEPTADA" if aceptada else "RECHAZADA"), historial_recorrido, mensaje
 
-        for simbolo in cadena:
-            if simbolo not in self.alfabeto:
-                return "RECHAZADA", historial_recorrido, f"Error: El símbolo '{simbolo}' no pertenece al alfabeto."
-            
-            try:
-                estado_actual = self.transiciones[estado_actual][simbolo]
-                historial_recorrido.append((estado_actual, simbolo))
-            except KeyError:
-                return "RECHAZADA", historial_recorrido, f"Proceso detenido: No hay transición definida desde el estado '{estado_actual}' con el símbolo '{simbolo}'."
-        
-        if estado_actual in self.estados_aceptacion:
-            return "ACEPTADA", historial_recorrido, f"Proceso finalizado. El estado final es '{estado_actual}', que es un estado de aceptación."
-        else:
-            return "RECHAZADA", historial_recorrido, f"Proceso finalizado. El estado final es '{estado_actual}', que NO es un estado de aceptación."
+    def evaluar_trayectoria(self, cadena):
+        """
+        Variante compacta de `evaluar_cadena` que devuelve el recorrido como índices enteros.
+
+        El recorrido se guarda en un único `array('i')` reservado de una vez, con un par
+        (estado_id, simbolo_id) por paso, en lugar de una lista de tuplas de nombres. Los
+        nombres se obtienen después, solo para los pasos que se necesiten, con
+        `decodificar_trayectoria`.
+
+        Args:
+            cadena (str): La cadena de símbolos a evaluar. Se usa '*' para la cadena vacía.
+
+        Returns:
+            tuple: Una tupla con tres elementos:
+                   - bool: True si la cadena es aceptada, False en caso contrario.
+                   - array: Los pares (estado_id, simbolo_id) aplanados; el primero es
+                            (estado inicial, -1).
+                   - str: Un mensaje descriptivo del resultado o del error encontrado.
+        """
+        if cadena == '*':
+            aceptada, mensaje = self._resultado_cadena_vacia()
+            return aceptada, array('i', (self._inicial_id, -1)), mensaje
+
+        simbolos = self._codificar(cadena)
+        estado, posicion, codigo = self._recorrer(self._inicial_id, simbolos)
+
+        tabla = self._tabla
+        num_simbolos = len(self._simbolos_por_id)
+        trayectoria = array('i', (0,)) * (2 * (posicion + 1))
+        estado_actual = trayectoria[0] = self._inicial_id
+        trayectoria[1] = -1
+        for i in range(posicion):
+            s = simbolos[i]
+            estado_actual = tabla[estado_actual * num_simbolos + s]
+            trayectoria[2 * i + 2] = estado_actual
+            trayectoria[2 * i + 3] = s
+
+        aceptada, mensaje = self._resultado_recorrido(cadena, estado, posicion, codigo)
+        return aceptada, trayectoria, mensaje
+
+    def decodificar_trayectoria(self, trayectoria, inicio=0, fin=None):
+        """
+        Traduce a nombres los pasos de una trayectoria devuelta por `evaluar_trayectoria`.
+
+        Args:
+            trayectoria (array): Los pares (estado_id, simbolo_id) aplanados.
+            inicio (int, optional): Primer paso a traducir. Por defecto es 0.
+            fin (int, optional): Paso siguiente al último a traducir. Por defecto, todos.
+
+        Returns:
+            list[tuple]: Los pasos pedidos como tuplas (estado, simbolo), con el mismo
+                         formato que el historial de `evaluar_cadena`.
+        """
+        estados_por_id = self._estados_por_id
+        simbolos_por_id = self._simbolos_por_id
+        pares = zip(trayectoria[2 * inicio:None if fin is None else 2 * fin:2],
+                    trayectoria[2 * inicio + 1:None if fin is None else 2 * fin:2])
+        return [(estados_por_id[e], simbolos_por_id[s] if s >= 0 else None) for e, s in pares]
+
+    def _resultado_cadena_vacia(self):
+        """
+        Determina el resultado de evaluar la cadena vacía.
+
+        Returns:
+            tuple: (bool, str) con el veredicto y el mensaje descriptivo.
+        """
+        if self._inicial_acepta:
+            return True, "La cadena vacía es aceptada porque el estado inicial es de aceptación."
+        return False, "La cadena vacía es rechazada porque el estado inicial no es de aceptación."
+
+    def _resultado_recorrido(self, cadena, estado, posicion, codigo):
+        """
+        Determina el veredicto y el mensaje a partir del resultado de `self._recorrer`.
+
+        Args:
+            cadena (str): La cadena evaluada.
+            estado (int): El índice del estado en el que se detuvo el recorrido.
+            posicion (int): El número de símbolos consumidos.
+            codigo (int): El motivo de la detención (_FIN, _SIMBOLO_INVALIDO o _SIN_TRANSICION).
+
+        Returns:
+            tuple: (bool, str) con el veredicto y el mensaje descriptivo.
+        """
+        if codigo == _SIMBOLO_INVALIDO:
+            return False, f"Error: El símbolo '{cadena[posicion]}' no pertenece al alfabeto."
+        if codigo == _SIN_TRANSICION:
+            return False, f"Proceso detenido: No hay transición definida desde el estado '{self._estados_por_id[estado]}' con el símbolo '{cadena[posicion]}'."
+
+        estado_actual = self._estados_por_id[estado]
+        if self._aceptacion[estado]:
+            return True, f"Proceso finalizado. El estado final es '{estado_actual}', que es un estado de aceptación."
+        return False, f"Proceso finalizado. El estado final es '{estado_actual}', que NO es un estado de aceptación."
+
+    def _reconstruir_historial(self, simbolos, longitud):
+        """
+        Reconstruye el historial del recorrido para los primeros símbolos de una cadena.
+
+        Reutiliza la representación ya preparada por `_codificar`, de modo que la cadena
+        no se vuelve a codificar ni se recorre carácter a carácter como `str`.
+
+        Args:
+            simbolos (bytes or list[int]): Los índices de símbolo de la cadena evaluada.
+            longitud (int): El número de símbolos que el autómata consumió con éxito.
+
+        Returns:
+            list[tuple]: El historial del recorrido como lista de tuplas (estado, simbolo).
+        """
+        tabla = self._tabla
+        estados_por_id = self._estados_por_id
+        simbolos_por_id = self._simbolos_por_id
+        num_simbolos = len(simbolos_por_id)
+
+        # La longitud del historial se conoce de antemano: se reserva de una vez.
+        estado = self._inicial_id
+        historial_recorrido = [None] * (longitud + 1)
+        historial_recorrido[0] = (self.estado_inicial, None)
+        for i in range(longitud):
+            s = simbolos[i]
+            estado = tabla[estado * num_simbolos + s]
+            historial_recorrido[i + 1] = (estados_por_id[estado], simbolos_por_id[s])
+        return historial_recorrido
+
+    def acepta(self, cadena):
+        """
+        Indica si una cadena es aceptada por el AFD, sin construir el historial del recorrido.
+
+        Es la variante rápida de `evaluar_cadena` para cuando solo interesa el veredicto.
+
+        Args:
+            cadena (str): La cadena de símbolos a evaluar. Se usa '*' para la cadena vacía.
+
+        Returns:
+            bool: True si la cadena es aceptada, False en caso contrario.
+        """
+        if self._inicial_id < 0:
+            return False
+        if cadena == '*':
+            return self._inicial_acepta
+
+        estado, _, codigo = self._recorrer_min(self._inicial_min, self._codificar(cadena))
+        return codigo == _FIN and self._aceptacion_min[estado] == 1
+
+    def evaluar_lote(self, cadenas):
+        """
+        Determina, para cada cadena de una lista, si es aceptada por el AFD.
+
+        A diferencia de `evaluar_cadena`, no construye el historial del recorrido ni
+        los mensajes descriptivos, por lo que resulta adecuado para clasificar grandes
+        cantidades de cadenas (ej. baterías de pruebas).
+
+        Args:
+            cadenas (list[str]): Las cadenas a evaluar. Se usa '*' para la cadena vacía.
+
+        Returns:
+            list[bool]: Una lista con True en las posiciones de las cadenas aceptadas
+                        y False en las rechazadas, en el mismo orden de entrada.
+        """
+        if self._inicial_id < 0:
+            return [False] * len(cadenas)
+
+        recorrer = self._recorrer_min
+        codificar = self._codificar
+        aceptacion = self._aceptacion_min
+        inicial = self._inicial_min
+
+        resultados = []
+        for cadena in cadenas:
+            if cadena == '*':
+                resultados.append(self._inicial_acepta)
+                continue
+            estado, _, codigo = recorrer(inicial, codificar(cadena))
+            resultados.append(codigo == _FIN and aceptacion[estado] == 1)
+        return resultados
 
     def generar_cadenas_lenguaje(self, num_cadenas=10):
         """
@@ -145,36 +680,104 @@ class AutomataAFD:
             list[str]: Una lista de cadenas aceptadas por el autómata, ordenadas por
                        longitud (de menor a mayor). Incluye '*' si la cadena vacía es válida.
         """
-        if not self.estado_inicial:
+        if self._inicial_id < 0:
             return []
 
         cadenas_validas = []
         
-        if self.estado_inicial in self.estados_aceptacion:
+        if self._inicial_acepta:
             cadenas_validas.append("*")
         
-        cola = deque([(self.estado_inicial, "")])
-        visitados = set([(self.estado_inicial, "")])
-        
-        while cola and len(cadenas_validas) < num_cadenas:
-            estado_actual, cadena = cola.popleft()
-
-            if estado_actual in self.transiciones:
-                for simbolo, estado_siguiente in sorted(self.transiciones[estado_actual].items()):
-                    nueva_cadena = cadena + simbolo
-                    if (estado_siguiente, nueva_cadena) not in visitados:
-                        visitados.add((estado_siguiente, nueva_cadena))
-                        cola.append((estado_siguiente, nueva_cadena))
-                        
-                        if estado_siguiente in self.estados_aceptacion and nueva_cadena != "":
-                            cadenas_validas.append(nueva_cadena)
-        
+        # Solo se exploran estados desde los que se puede llegar a uno de aceptación;
+        # las ramas muertas nunca producen cadenas y crecen exponencialmente.
+        utiles = self._estados_coaccesibles()
+        if not utiles[self._inicial_min]:
+            return cadenas_validas
+
+        # El BFS trabaja solo con índices enteros de estados y símbolos y avanza por
+        # niveles (todas las cadenas de longitud n antes que las de longitud n + 1).
+        # Los nodos del árbol de búsqueda se guardan en tres arreglos paralelos
+        # (estado_id, indice_padre, simbolo_id); las cadenas se reconstruyen siguiendo
+        # los padres solo cuando son aceptadas. Al ser el autómata determinista, cada
+        # nodo corresponde a una cadena distinta.
+        salidas = self._salidas
+        aceptacion = self._aceptacion_min
+        estados = array('i', [self._inicial_min])
+        padres = array('i', [-1])
+        simbolos = array('i', [-1])
+
+        inicio_nivel, fin_nivel = 0, 1
+        while inicio_nivel < fin_nivel and len(cadenas_validas) < num_cadenas:
+            for indice in range(inicio_nivel, fin_nivel):
+                for s, estado_siguiente in salidas[estados[indice]]:
+                    if not utiles[estado_siguiente]:
+                        continue
+                    estados.append(estado_siguiente)
+                    padres.append(indice)
+                    simbolos.append(s)
+
+                    if aceptacion[estado_siguiente]:
+                        cadenas_validas.append(self._reconstruir_cadena(padres, simbolos, len(estados) - 1))
+                        # Se corta en cuanto se alcanza el límite, sin encolar más nodos.
+                        if len(cadenas_validas) >= num_cadenas:
+                            return cadenas_validas
+            inicio_nivel, fin_nivel = fin_nivel, len(estados)
+
         return cadenas_validas
 
+    def _estados_coaccesibles(self):
+        """
+        Calcula los estados desde los que es posible alcanzar un estado de aceptación.
+
+        Realiza una búsqueda en anchura sobre las transiciones invertidas partiendo de
+        los estados de aceptación, visitando cada estado una sola vez.
+
+        Returns:
+            bytearray: Un mapa indexado por el índice de estado, con 1 en los estados
+                       coaccesibles y 0 en el resto.
+        """
+        predecesores = [[] for _ in self._salidas]
+        for origen, salidas in enumerate(self._salidas):
+            for _, destino in salidas:
+                predecesores[destino].append(origen)
+
+        visitados = bytearray(self._aceptacion_min)
+        cola = deque(i for i, es_aceptacion in enumerate(visitados) if es_aceptacion)
+        while cola:
+            estado = cola.popleft()
+            for origen in predecesores[estado]:
+                if not visitados[origen]:
+                    visitados[origen] = 1
+                    cola.append(origen)
+        return visitados
+
+    def _reconstruir_cadena(self, padres, simbolos, indice):
+        """
+        Reconstruye la cadena asociada a un nodo del árbol de búsqueda de `generar_cadenas_lenguaje`.
+
+        Args:
+            padres (array): Índice del nodo padre de cada nodo (-1 para la raíz).
+            simbolos (array): Índice del símbolo con el que se llegó a cada nodo.
+            indice (int): Índice del nodo cuya cadena se quiere obtener.
+
+        Returns:
+            str: La cadena formada por los símbolos desde la raíz hasta el nodo.
+        """
+        simbolos_por_id = self._simbolos_por_id
+        cadena = []
+        while indice > 0:
+            cadena.append(simbolos_por_id[simbolos[indice]])
+            indice = padres[indice]
+        return "".join(reversed(cadena))
+
     def guardar_a_json(self, nombre_archivo):
         """
         Guarda la definición del autómata en un archivo JSON.
 
+        Si la librería opcional `orjson` está instalada se usa para serializar, por ser
+        notablemente más rápida que el módulo `json` estándar con autómatas grandes.
+        Equivale a `datos_json` seguido de `escribir_json`.
+
         Args:
             nombre_archivo (str): La ruta completa del archivo donde se guardará el autómata.
 
@@ -182,28 +785,81 @@ class AutomataAFD:
             tuple: Una tupla (bool, str) donde el primer elemento indica si la operación
                    fue exitosa y el segundo es un mensaje de estado.
         """
-        data = {
-            "estados": list(self.estados),
-            "alfabeto": list(self.alfabeto),
+        return self.escribir_json(self.datos_json(), nombre_archivo)
+
+    def datos_json(self):
+        """
+        Devuelve una copia de la definición del autómata en el formato del archivo JSON.
+
+        La copia no comparte ningún contenedor con el autómata, así que puede escribirse
+        desde otro hilo aunque el autómata se redefina mientras tanto.
+
+        Returns:
+            dict: Los estados, el alfabeto, el estado inicial, los estados de aceptación
+                  y las transiciones {origen: {simbolo: destino}}.
+        """
+        # Las listas se ordenan para que guardar dos veces el mismo autómata produzca
+        # exactamente el mismo archivo.
+        return {
+            "estados": sorted(self.estados),
+            "alfabeto": sorted(self.alfabeto),
             "estado_inicial": self.estado_inicial,
-            "estados_aceptacion": list(self.estados_aceptacion),
-            "transiciones": self.transiciones
+            "estados_aceptacion": sorted(self.estados_aceptacion),
+            "transiciones": {origen: dict(sorted(fila.items())) for origen, fila in sorted(self.transiciones.items())}
         }
+
+    @staticmethod
+    def escribir_json(data, nombre_archivo):
+        """
+        Serializa y escribe en disco los datos devueltos por `datos_json`.
+
+        Es la parte del guardado que accede al disco; al no tocar ningún autómata, puede
+        ejecutarse en otro hilo. La escritura es atómica: el archivo destino se reemplaza
+        solo cuando el nuevo contenido está completo en disco.
+
+        Args:
+            data (dict): Los datos a guardar.
+            nombre_archivo (str): La ruta completa del archivo donde se guardará el autómata.
+
+        Returns:
+            tuple: Una tupla (bool, str) donde el primer elemento indica si la operación
+                   fue exitosa y el segundo es un mensaje de estado.
+        """
+        # Se escribe primero en un archivo temporal y luego se reemplaza el destino, de
+        # modo que un fallo a mitad de escritura nunca deja un archivo incompleto.
+        # El temporal se crea con un nombre único en la misma carpeta (os.replace no puede
+        # cruzar sistemas de archivos), así que nunca pisa un archivo existente.
+        ruta_temporal = None
         try:
-            with open(nombre_archivo, 'w') as f:
-                json.dump(data, f, indent=4)
+            contenido = _a_json(data)
+            descriptor, ruta_temporal = tempfile.mkstemp(dir=os.path.dirname(nombre_archivo) or ".", suffix=".tmp")
+            with open(descriptor, 'wb') as f:
+                # mkstemp crea el archivo legible solo por el propietario; se le dan los
+                # permisos habituales de un archivo nuevo.
+                os.chmod(ruta_temporal, 0o644)
+                f.write(contenido)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(ruta_temporal, nombre_archivo)
             return True, "Autómata guardado exitosamente."
         except Exception as e:
+            # Solo se borra el temporal si lo creó esta llamada.
+            if ruta_temporal is not None and os.path.exists(ruta_temporal):
+                os.remove(ruta_temporal)
             return False, f"Error al guardar el archivo: {e}"
 
-    def cargar_de_json(self, nombre_archivo):
+    def cargar_de_json(self, nombre_archivo, minimizar=True):
         """
         Carga la definición de un autómata desde un archivo JSON.
 
-        Actualiza el estado interno del objeto con los datos del archivo.
+        Actualiza el estado interno del objeto con los datos del archivo. Si el archivo
+        no se puede leer o su contenido no es válido, el autómata anterior queda intacto.
+        Equivale a `leer_json` seguido de `cargar_datos`.
 
         Args:
             nombre_archivo (str): La ruta del archivo JSON a cargar.
+            minimizar (bool): Igual que en `definir_automata`: si es True (por defecto),
+                              se calcula además el AFD mínimo equivalente.
 
         Returns:
             tuple: Una tupla (bool, result) donde:
@@ -211,22 +867,94 @@ class AutomataAFD:
                    - result: El diccionario con los datos cargados si fue exitoso, o un
                              mensaje de error (str) si falló.
         """
-        try:
-            with open(nombre_archivo, 'r') as f:
-                data = json.load(f)
-            
-            # Asignación de los datos al objeto (actualización del estado interno)
-            self.estados = set(data.get("estados", []))
-            self.alfabeto = set(data.get("alfabeto", []))
-            self.estado_inicial = data.get("estado_inicial")
-            self.estados_aceptacion = set(data.get("estados_aceptacion", []))
-            self.transiciones = data.get("transiciones", {})
+        exito, resultado = self.leer_json(nombre_archivo)
+        if not exito:
+            return False, resultado
+        return self.cargar_datos(resultado, minimizar)
 
-            # Retorna True junto con el diccionario de datos para que la GUI se actualice.
-            return True, data
+    @staticmethod
+    def leer_json(nombre_archivo):
+        """
+        Lee y decodifica un archivo JSON de autómata, sin modificar ningún autómata.
+
+        Es la parte de la carga que accede al disco; al no tocar el estado del objeto,
+        puede ejecutarse en otro hilo.
+
+        Args:
+            nombre_archivo (str): La ruta del archivo JSON a leer.
+
+        Returns:
+            tuple: Una tupla (bool, result) donde:
+                   - bool: True si la lectura fue exitosa, False en caso contrario.
+                   - result: Los datos decodificados si fue exitosa, o un mensaje de
+                             error (str) si falló.
+        """
+        try:
+            with open(nombre_archivo, 'rb') as f:
+                contenido = f.read()
+            return True, _desde_json(contenido)
         except FileNotFoundError:
             return False, f"Error: El archivo '{nombre_archivo}' no fue encontrado."
-        except json.JSONDecodeError:
+        except ValueError:
+            # json.JSONDecodeError y los errores de codificación del contenido.
             return False, f"Error: El archivo '{nombre_archivo}' tiene un formato JSON inválido."
-        except KeyError as e:
-            return False, f"Error: Archivo JSON incompleto. Falta la clave {e}."
\ No newline at end of file
+
+    def cargar_datos(self, data, minimizar=True):
+        """
+        Actualiza el autómata con los datos ya decodificados de un archivo JSON.
+
+        Si los datos no son válidos, el autómata anterior queda intacto.
+
+        Args:
+            data (dict): Los datos devueltos por `leer_json`.
+            minimizar (bool): Igual que en `definir_automata`.
+
+        Returns:
+            tuple: Una tupla (bool, result) donde:
+                   - bool: True si la carga fue exitosa, False en caso contrario.
+                   - result: El diccionario de datos si fue exitoso, o un mensaje de
+                             error (str) si falló.
+        """
+        if not isinstance(data, dict):
+            return False, "Error: Archivo JSON inconsistente. El contenido debe ser un objeto con los componentes del autómata."
+
+        # La forma de los datos se comprueba antes de asignar nada: una clave ausente o un
+        # componente del tipo equivocado no debe dejar el autómata a medio actualizar.
+        for clave in ("estados", "alfabeto", "estado_inicial", "estados_aceptacion", "transiciones"):
+            if clave not in data:
+                return False, f"Error: Archivo JSON incompleto. Falta la clave '{clave}'."
+        for clave in ("estados", "alfabeto", "estados_aceptacion"):
+            if not isinstance(data[clave], list):
+                return False, f"Error: Archivo JSON inconsistente. '{clave}' debe ser una lista."
+        transiciones = data["transiciones"]
+        if not isinstance(transiciones, dict) or not all(isinstance(fila, dict) for fila in transiciones.values()):
+            return False, "Error: Archivo JSON inconsistente. 'transiciones' debe ser un objeto {origen: {simbolo: destino}}."
+
+        # Si la validación falla a mitad de la asignación, se restaura el estado previo.
+        respaldo = self.__dict__.copy()
+        try:
+            # Asignación de los datos al objeto (actualización del estado interno).
+            # Los nombres se internan igual que en definir_automata.
+            intern = sys.intern
+            self.estados = {intern(e) for e in data["estados"]}
+            self.alfabeto = {intern(s) for s in data["alfabeto"]}
+            self.estado_inicial = intern(data["estado_inicial"])
+            self.estados_aceptacion = frozenset(intern(e) for e in data["estados_aceptacion"])
+            self.transiciones = {
+                intern(origen): {intern(simbolo): intern(destino) for simbolo, destino in fila.items()}
+                for origen, fila in transiciones.items()
+            }
+            self._usar_minimo = minimizar
+            self._compilar_tabla()
+
+            # Retorna True junto con el diccionario de datos para que la GUI se actualice.
+            return True, data
+        except ValueError as e:
+            self.__dict__.update(respaldo)
+            return False, f"Error: Archivo JSON inconsistente. {e}"
+        except TypeError:
+            self.__dict__.update(respaldo)
+            return False, "Error: Archivo JSON inconsistente. Los estados, símbolos y transiciones deben ser cadenas de texto."
+        except Exception:
+            self.__dict__.update(respaldo)
+            raise
\ No newline at end of file
@@ -1,5 +1,3 @@
-import json
-import os
 from automata_afd import AutomataAFD
 
 class AutomataLogic:
@@ -11,6 +9,12 @@ class AutomataLogic:
     Esta clase desacopla la interfaz gráfica (GUI) de la lógica del modelo
     matemático del autómata.
     """
+    # Número máximo de evaluaciones memorizadas por `evaluar_cadena`.
+    MAX_CACHE_EVALUACIONES = 1024
+    # Longitud máxima de una cadena cuyo resultado se memoriza: cada entrada guarda el
+    # recorrido completo (y sus líneas), así que las cadenas largas no se conservan.
+    MAX_LONGITUD_MEMORIZADA = 1000
+
     def __init__(self):
         """
         Inicializa la clase con una instancia de AutomataAFD.
@@ -18,8 +22,14 @@ class AutomataLogic:
         Atributos:
             automata (AutomataAFD): Una instancia del modelo de autómata que se
                                    gestionará a lo largo del ciclo de vida de la aplicación.
+            _cache_evaluaciones (dict): Resultados de `evaluar_cadena` ya calculados para el
+                                        autómata actual, indexados por cadena.
+            _definido (bool): Indica si hay un autómata válido (definido o cargado con
+                              éxito) sobre el que operar.
         """
         self.automata = AutomataAFD()
+        self._cache_evaluaciones = {}
+        self._definido = False
 
     def definir_automata(self, states, alphabet, initial_state, acceptance_states, transitions):
         """
@@ -36,38 +46,177 @@ class AutomataLogic:
             str: Un mensaje indicando que el autómata se definió correctamente.
                  La validación de errores se maneja mediante excepciones en AutomataAFD.
         """
+        # Cualquier resultado memorizado pertenece al autómata anterior.
+        self._cache_evaluaciones.clear()
+        # Si la definición falla a medias, el modelo puede quedar inconsistente: no se
+        # considera definido hasta que la validación termina con éxito.
+        self._definido = False
         self.automata.definir_automata(states, alphabet, transitions, initial_state, acceptance_states)
+        self._definido = True
         return "Autómata definido correctamente."
 
     def evaluar_cadena(self, chain):
         """
         Evalúa si una cadena es aceptada por el autómata.
 
+        Los resultados se memorizan por cadena (hasta `MAX_CACHE_EVALUACIONES` entradas de
+        cadenas de hasta `MAX_LONGITUD_MEMORIZADA` símbolos), de modo que reevaluar una
+        cadena con el mismo autómata no repite el recorrido.
+
         Args:
             chain (str): La cadena a evaluar.
 
         Returns:
             tuple: Una tupla con tres elementos:
                    - str: "ACEPTADA" o "RECHAZADA", o None si no hay autómata definido.
-                   - list: El historial del recorrido, o None.
+                   - tuple: El historial del recorrido, o None.
                    - str: Un mensaje descriptivo del resultado o del error.
         """
-        if not self.automata.estado_inicial:
+        if not self._definido:
             return None, None, "Define un autómata primero."
-        return self.automata.evaluar_cadena(chain)
+        result, recorrido, message, _ = self._evaluar(chain)
+        return result, recorrido, message
+
+    def evaluar_cadena_con_traza(self, chain):
+        """
+        Evalúa una cadena y devuelve el recorrido ya redactado, un paso por línea.
+
+        Es la variante que usa la GUI: las líneas se generan la primera vez que se piden
+        para una cadena y se memorizan junto con su evaluación, así que la vista solo
+        tiene que unirlas.
+
+        Args:
+            chain (str): La cadena a evaluar.
+
+        Returns:
+            tuple: Una tupla con tres elementos:
+                   - str: "ACEPTADA" o "RECHAZADA", o None si no hay autómata definido.
+                   - tuple[str]: Las líneas que describen el recorrido, o None.
+                   - str: Un mensaje descriptivo del resultado o del error.
+        """
+        if not self._definido:
+            return None, None, "Define un autómata primero."
+        result, recorrido, message, trace_lines = self._evaluar(chain)
+        if trace_lines is None:
+            trace_lines = self._redactar_recorrido(chain, recorrido)
+            # Se completa la entrada memorizada (reasignar una clave existente no cambia
+            # su posición en el orden de descarte).
+            if chain in self._cache_evaluaciones:
+                self._cache_evaluaciones[chain] = (result, recorrido, message, trace_lines)
+        return result, trace_lines, message
+
+    def _evaluar(self, chain):
+        """
+        Evalúa una cadena con el autómata definido, usando la memoria de resultados.
+
+        Args:
+            chain (str): La cadena a evaluar.
+
+        Returns:
+            tuple: (resultado, historial, mensaje, líneas del recorrido). Las líneas son
+                   None hasta que `evaluar_cadena_con_traza` las pide por primera vez.
+        """
+        resultado = self._cache_evaluaciones.get(chain)
+        if resultado is None:
+            result, recorrido, message = self.automata.evaluar_cadena(chain)
+            # El historial se guarda como tupla para que el valor memorizado sea inmutable.
+            resultado = (result, tuple(recorrido), message, None)
+            if len(chain) > self.MAX_LONGITUD_MEMORIZADA:
+                return resultado
+            if len(self._cache_evaluaciones) >= self.MAX_CACHE_EVALUACIONES:
+                # Se descarta la entrada más antigua (los dict conservan el orden de inserción).
+                del self._cache_evaluaciones[next(iter(self._cache_evaluaciones))]
+            self._cache_evaluaciones[chain] = resultado
+        return resultado
+
+    @staticmethod
+    def _redactar_recorrido(chain, recorrido):
+        """
+        Describe en texto cada paso de un recorrido.
+
+        Args:
+            chain (str): La cadena evaluada.
+            recorrido (list[tuple]): El historial (estado, simbolo) devuelto por el modelo.
+
+        Returns:
+            tuple[str]: Una línea por paso, empezando por el estado inicial.
+        """
+        if chain == '*':
+            return ("1. La cadena es vacía. El recorrido no tiene transiciones.",)
+
+        estado_anterior = recorrido[0][0]
+        lineas = [None] * len(recorrido)
+        lineas[0] = f"1. Iniciando en el estado ({estado_anterior})."
+        for i in range(1, len(recorrido)):
+            estado, simbolo = recorrido[i]
+            lineas[i] = f"{i}. Desde el estado ({estado_anterior}) con el símbolo '{simbolo}' se transita al estado ({estado})."
+            estado_anterior = estado
+        return tuple(lineas)
+
+    def evaluar_cadena_compacta(self, chain):
+        """
+        Evalúa una cadena devolviendo el recorrido como índices enteros en lugar de nombres.
+
+        Delega en `AutomataAFD.evaluar_trayectoria`; los pasos que se quieran mostrar se
+        traducen después con `decodificar_recorrido`. El resultado no se memoriza.
+
+        Args:
+            chain (str): La cadena a evaluar.
+
+        Returns:
+            tuple: Una tupla con tres elementos:
+                   - bool: Si la cadena es aceptada, o None si no hay autómata definido.
+                   - array: Los pares (estado_id, simbolo_id) aplanados, o None.
+                   - str: Un mensaje descriptivo del resultado o del error.
+        """
+        if not self._definido:
+            return None, None, "Define un autómata primero."
+        return self.automata.evaluar_trayectoria(chain)
+
+    def decodificar_recorrido(self, trajectory, start=0, end=None):
+        """
+        Traduce a nombres de estados y símbolos los pasos [start, end) de un recorrido compacto.
+
+        Args:
+            trajectory (array): El recorrido devuelto por `evaluar_cadena_compacta`.
+            start (int, optional): Primer paso a traducir.
+            end (int, optional): Paso siguiente al último a traducir (por defecto, todos).
+
+        Returns:
+            list[tuple]: Los pasos como tuplas (estado, simbolo).
+        """
+        return self.automata.decodificar_trayectoria(trajectory, start, end)
+
+    def evaluar_cadenas_lote(self, chains):
+        """
+        Evalúa una lista de cadenas en una sola llamada, sin construir recorridos.
+
+        Pensado para pruebas automatizadas que clasifican muchas cadenas: delega en
+        `AutomataAFD.evaluar_lote` y evita la comprobación, el historial y la memoria
+        de resultados que `evaluar_cadena` hace por cada cadena.
+
+        Args:
+            chains (list[str]): Las cadenas a evaluar.
+
+        Returns:
+            list[bool] or None: True o False para cada cadena (en el mismo orden), o None
+                                si no hay un autómata definido.
+        """
+        if not self._definido:
+            return None
+        return self.automata.evaluar_lote(chains)
 
     def generar_cadenas(self):
         """
         Genera una lista de cadenas que pertenecen al lenguaje del autómata.
 
         Returns:
-            str: Una cadena de texto formateada con las cadenas válidas encontradas,
-                 o un mensaje de advertencia si no hay un autómata definido.
+            list[str] or None: Las cadenas válidas encontradas (las más cortas primero),
+                               o None si no hay un autómata definido.
         """
-        if not self.automata.estado_inicial:
-            return "Define un autómata primero."
-        chains = self.automata.generar_cadenas_lenguaje(10)
-        return "Cadenas Válidas:\n" + "\n".join(chains)
+        if not self._definido:
+            return None
+        return self.automata.generar_cadenas_lenguaje(10)
 
     def guardar_automata(self, file_path):
         """
@@ -80,11 +229,42 @@ class AutomataLogic:
             str: Un mensaje indicando el resultado de la operación (éxito o error),
                  o una advertencia si no hay autómata para guardar.
         """
-        if not self.automata.estado_inicial:
-            return "Define un autómata para poder guardarlo."
-        
+        success, result = self.datos_automata()
+        if not success:
+            return result
+        return self.escribir_automata(result, file_path)
+
+    def datos_automata(self):
+        """
+        Toma una copia de la definición del autómata actual, lista para `escribir_automata`.
+
+        Se llama en el hilo que define y carga autómatas, de modo que la copia siempre
+        corresponde a un autómata completo aunque la escritura se haga después en otro hilo.
+
+        Returns:
+            tuple: (bool, result), con los datos del autómata si hay uno definido o un
+                   mensaje de advertencia (str) si no lo hay.
+        """
+        if not self._definido:
+            return False, "Define un autómata para poder guardarlo."
+        return True, self.automata.datos_json()
+
+    def escribir_automata(self, data, file_path):
+        """
+        Escribe en un archivo JSON los datos tomados con `datos_automata`.
+
+        Es la parte lenta de `guardar_automata` (la serialización y el acceso al disco) y
+        puede ejecutarse en un hilo auxiliar.
+
+        Args:
+            data (dict): Los datos del autómata.
+            file_path (str): La ruta del archivo donde se guardará el autómata.
+
+        Returns:
+            str: Un mensaje indicando el resultado de la operación (éxito o error).
+        """
         # Recibe el estado de éxito y el mensaje/error de AutomataAFD.
-        success, message = self.automata.guardar_a_json(file_path)
+        success, message = self.automata.escribir_json(data, file_path)
         return message # Retorna el mensaje de éxito o error.
 
     def cargar_automata(self, file_path):
@@ -99,12 +279,49 @@ class AutomataLogic:
                    - str: Un mensaje de estado ("Autómata cargado." o un mensaje de error).
                    - dict or None: El diccionario con los datos del autómata si la carga fue exitosa, de lo contrario None.
         """
-        # Recibe True/False y los datos/mensaje de error de AutomataAFD.
-        success, result = self.automata.cargar_de_json(file_path)
+        success, result = self.leer_automata(file_path)
+        if not success:
+            return result, None
+        return self.aplicar_automata(result)
+
+    def leer_automata(self, file_path):
+        """
+        Lee y decodifica un archivo JSON de autómata sin modificar el autómata actual.
+
+        Es la parte lenta de `cargar_automata` (el acceso al disco) y puede ejecutarse en
+        un hilo auxiliar; los datos se aplican después con `aplicar_automata`.
+
+        Args:
+            file_path (str): La ruta del archivo JSON a leer.
+
+        Returns:
+            tuple: (bool, result), con los datos decodificados si la lectura fue exitosa
+                   o un mensaje de error (str) si falló.
+        """
+        return self.automata.leer_json(file_path)
+
+    def aplicar_automata(self, data):
+        """
+        Reemplaza el autómata actual por el descrito en los datos leídos con `leer_automata`.
+
+        Args:
+            data (dict): Los datos decodificados del archivo.
+
+        Returns:
+            tuple: Una tupla con dos elementos, igual que `cargar_automata`:
+                   - str: Un mensaje de estado ("Autómata cargado." o un mensaje de error).
+                   - dict or None: Los datos del autómata si la carga fue exitosa, de lo contrario None.
+        """
+        # Recibe True/False y los datos/mensaje de error de AutomataAFD. Si la carga
+        # falla, el modelo no se modifica y el autómata anterior sigue siendo válido.
+        success, result = self.automata.cargar_datos(data)
         
         if success:
+            # Cualquier resultado memorizado pertenece al autómata anterior.
+            self._cache_evaluaciones.clear()
+            self._definido = True
             # Si es exitoso, devuelve el mensaje de éxito y el diccionario de datos.
             return "Autómata cargado.", result
         else:
             # Si falla, devuelve el mensaje de error y None.
-            return result, None
\ No newline at end of file
+            return result, None
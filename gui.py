@@ -1,8 +1,41 @@
 import tkinter as tk
 from tkinter import ttk, filedialog
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from automata_logic import AutomataLogic
 
+# Índice "final" de Tk, como constante del módulo para no resolver `tk.END` en cada uso.
+_END = tk.END
+
+# Teclas permitidas en los cuadros de texto de solo lectura (desplazamiento y selección)
+# y máscaras de los modificadores Shift y Control en `event.state`.
+_READ_ONLY_ALLOWED_KEYS = frozenset({"Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next"})
+_SHIFT_MASK = 0x1
+_CONTROL_MASK = 0x4
+
+# Un elemento de una lista separada por comas: cualquier secuencia sin comas ni espacios.
+_TOKEN_RE = re.compile(r"[^,\s]+")
+# Una transición por línea: exactamente tres campos separados por espacios o tabulaciones.
+_TRANSITION_RE = re.compile(r"^[ \t]*(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]*$", re.MULTILINE)
+# Cualquier línea con contenido; sirve para detectar las que no son transiciones válidas.
+_NONBLANK_LINE_RE = re.compile(r"^[ \t]*\S", re.MULTILINE)
+
+# Autómata de ejemplo que se carga al iniciar. Se guarda ya estructurado, junto con su
+# representación textual para los campos, que se calcula una sola vez al importar.
+_EXAMPLE_STATES = ("q0", "q1", "q2")
+_EXAMPLE_ALPHABET = ("a", "b")
+_EXAMPLE_INITIAL = "q0"
+_EXAMPLE_ACCEPTANCE = ("q0", "q2")
+_EXAMPLE_TRANSITIONS = (("q0", "a", "q1"), ("q0", "b", "q0"), ("q1", "a", "q1"),
+                        ("q1", "b", "q2"), ("q2", "a", "q2"), ("q2", "b", "q2"))
+_EXAMPLE_TEXT = {
+    "states": ", ".join(_EXAMPLE_STATES),
+    "alphabet": ", ".join(_EXAMPLE_ALPHABET),
+    "acceptance": ", ".join(_EXAMPLE_ACCEPTANCE),
+    "transitions": "\n".join(" ".join(t) for t in _EXAMPLE_TRANSITIONS),
+}
+
 class AutomataGUI:
     """
     Clase principal responsable de la Interfaz Gráfica de Usuario (GUI) del simulador de AFD.
@@ -12,6 +45,9 @@ class AutomataGUI:
     la "Vista" y el "Controlador" en un patrón MVC simple, delegando toda la lógica
     de negocio a una instancia de `AutomataLogic`.
     """
+    # Tipos de archivo de los diálogos de guardar/cargar (se construyen una sola vez).
+    _JSON_FILETYPES = (("JSON files", "*.json"),)
+
     def __init__(self, master):
         """
         Inicializa la ventana principal de la aplicación y sus componentes.
@@ -20,11 +56,20 @@ class AutomataGUI:
             master (tk.Tk): La ventana raíz de la aplicación Tkinter.
         """
         self.master = master
+        # La ventana se oculta mientras se construye: así no se mapea ni se redibuja con
+        # cada widget que se agrega, sino una sola vez con la interfaz completa.
+        master.withdraw()
         master.title("Simulador Interactivo de AFD")
         master.geometry("800x600")
 
         # Inicializa la clase de lógica para el manejo de datos y operaciones.
         self.automata_logic = AutomataLogic()
+        # Un único hilo auxiliar para las operaciones lentas (lectura/escritura de archivos
+        # y generación de cadenas): se ejecutan en orden, de una en una, y la ventana sigue
+        # respondiendo mientras tanto.
+        self._background_pool = ThreadPoolExecutor(max_workers=1)
+        # Carpeta en la que se abren los diálogos de archivo: la del último archivo elegido.
+        self._last_dir = os.getcwd()
         
         # --- Configuración del Contenedor Principal y Scrollbar ---
         self.main_container = ttk.Frame(master, padding="10")
@@ -40,17 +85,34 @@ class AutomataGUI:
         self.input_canvas = tk.Canvas(input_container)
         self.input_canvas.pack(side="left", fill="both", expand=True)
 
-        scrollbar = ttk.Scrollbar(input_container, orient="vertical", command=self.input_canvas.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.input_canvas.configure(yscrollcommand=scrollbar.set)
+        # La barra solo se muestra cuando el contenido no cabe (ver `_do_reflow`).
+        self.input_scrollbar = ttk.Scrollbar(input_container, orient="vertical", command=self.input_canvas.yview)
+        self.input_scrollbar.pack(side="right", fill="y")
+        self.input_canvas.configure(yscrollcommand=self.input_scrollbar.set)
         
         # Frame interior donde se ubican todos los widgets de entrada.
         self.input_frame = ttk.Frame(self.input_canvas)
-        self.input_canvas.create_window((0, 0), window=self.input_frame, anchor="nw")
+        # Se guarda el id del elemento ventana para reutilizarlo al redimensionar.
+        self._input_window_id = self.input_canvas.create_window((0, 0), window=self.input_frame, anchor="nw")
+        self._reflow_pending = False
         self.input_frame.bind("<Configure>", self.on_frame_configure)
+        self.input_canvas.bind("<Configure>", self.on_canvas_configure)
 
         self.create_input_widgets() 
         self.load_example_automata() 
+        master.protocol("WM_DELETE_WINDOW", self.on_close)
+        master.deiconify()
+
+    
+    def on_close(self):
+        """
+        Cierra la aplicación descartando las tareas del hilo auxiliar que aún no empezaron.
+
+        Sin esto, al cerrar la ventana el proceso esperaría a que se ejecutaran todas las
+        operaciones encoladas antes de terminar.
+        """
+        self._background_pool.shutdown(wait=False, cancel_futures=True)
+        self.master.destroy()
 
     
     def on_frame_configure(self, event):
@@ -58,10 +120,80 @@ class AutomataGUI:
         Ajusta la región de desplazamiento del canvas cuando el frame interior cambia de tamaño.
 
         Este método se asegura de que la barra de desplazamiento cubra todo el contenido
-        del frame, incluso si se añaden o redimensionan widgets dinámicamente.
+        del frame, incluso si se añaden o redimensionan widgets dinámicamente. Durante
+        un redimensionado llegan muchos eventos seguidos, así que el recálculo se aplaza
+        hasta que Tk queda inactivo y se hace una sola vez por ráfaga.
+        """
+        if self._reflow_pending:
+            return
+        self._reflow_pending = True
+        self.master.after_idle(self._do_reflow)
+
+    
+    def _do_reflow(self):
+        """
+        Recalcula la región de desplazamiento del canvas (ver `on_frame_configure`).
+
+        Si todo el contenido cabe en el canvas, oculta la barra de desplazamiento y vuelve
+        al inicio; en caso contrario, la muestra.
         """
+        self._reflow_pending = False
         self.input_canvas.configure(scrollregion=self.input_canvas.bbox("all"))
-        self.input_canvas.itemconfig(self.input_canvas.create_window(0, 0, window=self.input_frame, anchor="nw"), width=self.input_canvas.winfo_width())
+
+        fits = self.input_frame.winfo_reqheight() <= self.input_canvas.winfo_height()
+        if fits and self.input_scrollbar.winfo_ismapped():
+            self.input_scrollbar.pack_forget()
+            self.input_canvas.yview_moveto(0)
+        elif not fits and not self.input_scrollbar.winfo_ismapped():
+            self.input_scrollbar.pack(side="right", fill="y", before=self.input_canvas)
+
+    
+    def on_canvas_configure(self, event):
+        """
+        Ajusta el ancho del frame interior al del canvas cuando este cambia de tamaño.
+
+        El ancho nuevo llega en el propio evento, por lo que no hace falta consultarlo
+        al sistema de ventanas con `winfo_width()`.
+        """
+        self.input_canvas.itemconfig(self._input_window_id, width=event.width)
+        # Con otro alto puede cambiar si hace falta la barra de desplazamiento.
+        self.on_frame_configure(event)
+
+    
+    def _run_in_background(self, on_done, func, *args, on_finish=None):
+        """
+        Ejecuta `func(*args)` en el hilo auxiliar y entrega el resultado en el hilo de Tk.
+
+        Tkinter no es seguro entre hilos, así que el hilo auxiliar no toca ningún widget:
+        el hilo principal consulta periódicamente si la tarea terminó y, en ese caso,
+        llama a `on_done` con su resultado. Si `func` o `on_done` lanzan una excepción,
+        se muestra en la `output_label`.
+
+        Args:
+            on_done (callable): Función que recibe el resultado de `func`.
+            func (callable): La operación a ejecutar (ej. `AutomataLogic.guardar_automata`).
+            *args: Los argumentos de la operación (ej. la ruta del archivo).
+            on_finish (callable, optional): Función sin argumentos que se llama siempre al
+                                            terminar, haya fallado o no (ej. para volver a
+                                            habilitar un botón).
+        """
+        future = self._background_pool.submit(func, *args)
+
+        def poll():
+            if not future.done():
+                self.master.after(20, poll)
+                return
+            try:
+                # Un fallo al aplicar el resultado (ej. al validar un autómata cargado) se
+                # muestra igual que uno de la propia tarea.
+                on_done(future.result())
+            except Exception as e:
+                self.output_label.config(text=f"Error: {e}", foreground="red")
+            finally:
+                if on_finish is not None:
+                    on_finish()
+
+        poll()
 
     
     def create_input_widgets(self):
@@ -75,36 +207,56 @@ class AutomataGUI:
         input_section = ttk.LabelFrame(self.input_frame, text="Definir Autómata", padding="10")
         input_section.pack(fill="x", pady=10)
 
-        # Campos de entrada para la definición del AFD
+        # Campos de entrada para la definición del AFD. Cada Entry está enlazado a un
+        # StringVar, que se lee y se asigna de una vez en lugar de con get/delete/insert.
         ttk.Label(input_section, text="Estados (ej: q0, q1):").pack(fill="x")
-        self.states_entry = ttk.Entry(input_section)
+        self.states_var = tk.StringVar()
+        self.states_entry = ttk.Entry(input_section, textvariable=self.states_var)
         self.states_entry.pack(fill="x")
         
         ttk.Label(input_section, text="Alfabeto (ej: a, b):").pack(fill="x", pady=(10, 0))
-        self.alphabet_entry = ttk.Entry(input_section)
+        self.alphabet_var = tk.StringVar()
+        self.alphabet_entry = ttk.Entry(input_section, textvariable=self.alphabet_var)
         self.alphabet_entry.pack(fill="x")
 
         ttk.Label(input_section, text="Estado Inicial:").pack(fill="x", pady=(10, 0))
-        self.initial_state_entry = ttk.Entry(input_section)
+        self.initial_state_var = tk.StringVar()
+        self.initial_state_entry = ttk.Entry(input_section, textvariable=self.initial_state_var)
         self.initial_state_entry.pack(fill="x")
 
         ttk.Label(input_section, text="Estados de Aceptación (ej: q1):").pack(fill="x", pady=(10, 0))
-        self.acceptance_states_entry = ttk.Entry(input_section)
+        self.acceptance_states_var = tk.StringVar()
+        self.acceptance_states_entry = ttk.Entry(input_section, textvariable=self.acceptance_states_var)
         self.acceptance_states_entry.pack(fill="x")
 
         ttk.Label(input_section, text="Transiciones (ej: q0 a q1). No use el símbolo '*':").pack(fill="x", pady=(10, 0))
         self.transitions_text = tk.Text(input_section, height=5)
         self.transitions_text.pack(fill="x")
+
+        # Copia en Python del contenido de cada Entry, actualizada por un único trace de
+        # escritura por StringVar: al definir el autómata se lee de este diccionario sin
+        # ninguna llamada a Tcl. `_parsed_fields` guarda además el resultado ya analizado
+        # de cada campo y se invalida en el mismo trace; las transiciones se invalidan con
+        # el indicador `edit_modified` del Text.
+        self._field_values = {}
+        self._parsed_fields = {}
+        for name, var in (("states", self.states_var), ("alphabet", self.alphabet_var),
+                          ("initial_state", self.initial_state_var),
+                          ("acceptance_states", self.acceptance_states_var)):
+            self._field_values[name] = var.get()
+            var.trace_add("write", lambda *_, name=name, var=var: self._on_field_write(name, var))
+        self._cached_transitions = None
         
-        define_button = ttk.Button(input_section, text="Definir Autómata", command=self.define_automata_from_gui)
-        define_button.pack(fill="x", pady=10)
+        self.define_button = ttk.Button(input_section, text="Definir Autómata", command=self.define_automata_from_gui)
+        self.define_button.pack(fill="x", pady=10)
 
         # --- Sección de Acciones (Evaluar y Generar) ---
         action_section = ttk.LabelFrame(self.input_frame, text="Acciones", padding="10")
         action_section.pack(fill="x", pady=10)
 
         ttk.Label(action_section, text="Cadena a evaluar (usa '*' para la vacía):").pack(fill="x")
-        self.chain_entry = ttk.Entry(action_section)
+        self.chain_var = tk.StringVar()
+        self.chain_entry = ttk.Entry(action_section, textvariable=self.chain_var)
         self.chain_entry.pack(fill="x")
         ttk.Button(action_section, text="Evaluar Cadena", command=self.evaluate_chain).pack(fill="x", pady=5)
         
@@ -117,19 +269,40 @@ class AutomataGUI:
         eval_scrollbar = ttk.Scrollbar(eval_frame)
         eval_scrollbar.pack(side="right", fill="y")
 
-        self.evaluation_text = tk.Text(eval_frame, height=10, state='disabled', yscrollcommand=eval_scrollbar.set)
+        # Cuadro de solo lectura: en lugar de alternar su estado en cada evaluación, se
+        # descartan las teclas y eventos de edición del usuario.
+        self.evaluation_text = tk.Text(eval_frame, height=10, yscrollcommand=eval_scrollbar.set)
         self.evaluation_text.pack(side="left", fill="both", expand=True)
+        self.evaluation_text.bind("<Key>", self._block_text_edit)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.evaluation_text.bind(sequence, lambda event: "break")
 
         eval_scrollbar.config(command=self.evaluation_text.yview)
         # --- Fin Recorrido de la Evaluación ---
 
-        ttk.Button(action_section, text="Generar Cadenas", command=self.generate_chains).pack(fill="x", pady=5)
+        self.generate_button = ttk.Button(action_section, text="Generar Cadenas", command=self.generate_chains)
+        self.generate_button.pack(fill="x", pady=5)
+
+        # Lista de cadenas generadas: el Listbox recibe todas las cadenas en una sola
+        # llamada y solo dibuja las filas visibles.
+        ttk.Label(action_section, text="Cadenas válidas:").pack(fill="x", pady=(10, 0))
+        chains_frame = ttk.Frame(action_section)
+        chains_frame.pack(fill="both", expand=True)
+
+        chains_scrollbar = ttk.Scrollbar(chains_frame)
+        chains_scrollbar.pack(side="right", fill="y")
+
+        self.chains_listbox = tk.Listbox(chains_frame, height=10, yscrollcommand=chains_scrollbar.set)
+        self.chains_listbox.pack(side="left", fill="both", expand=True)
+
+        chains_scrollbar.config(command=self.chains_listbox.yview)
 
         # --- Sección de Gestión de Archivos ---
         file_section = ttk.LabelFrame(self.input_frame, text="Gestión de Archivos", padding="10")
         file_section.pack(fill="x", pady=10)
         ttk.Button(file_section, text="Guardar Autómata", command=self.save_automata).pack(fill="x", pady=5)
-        ttk.Button(file_section, text="Cargar Autómata", command=self.load_automata).pack(fill="x", pady=5)
+        self.load_button = ttk.Button(file_section, text="Cargar Autómata", command=self.load_automata)
+        self.load_button.pack(fill="x", pady=5)
         
         # Etiqueta para mensajes de error o éxito
         self.output_label = ttk.Label(self.input_frame, text="", foreground="blue")
@@ -142,13 +315,13 @@ class AutomataGUI:
         Muestra un mensaje de éxito o error en la `output_label`.
         """
         try:
-            # Recopilación de datos y pre-procesamiento (separación por comas, eliminación de espacios)
-            states = [s.strip() for s in self.states_entry.get().split(',') if s.strip()]
-            alphabet = [s.strip() for s in self.alphabet_entry.get().split(',') if s.strip()]
-            initial_state = self.initial_state_entry.get().strip()
-            acceptance_states = [s.strip() for s in self.acceptance_states_entry.get().split(',') if s.strip()]
-            transitions_str = self.transitions_text.get("1.0", tk.END).strip().split('\n')
-            transitions = [tuple(t.strip().split()) for t in transitions_str if t.strip()]
+            # Recopilación de datos y pre-procesamiento: una sola pasada de la expresión
+            # regular por campo separa por comas y descarta los espacios a la vez.
+            states = self._parse_field("states")
+            alphabet = self._parse_field("alphabet")
+            initial_state = self._field_values["initial_state"].strip()
+            acceptance_states = self._parse_field("acceptance_states")
+            transitions = self._parse_transitions()
 
             # Delegación a la capa de lógica (AutomataLogic)
             message = self.automata_logic.definir_automata(states, alphabet, initial_state, acceptance_states, transitions)
@@ -158,6 +331,58 @@ class AutomataGUI:
             self.output_label.config(text=f"Error al definir: {e}", foreground="red")
 
     
+    def _on_field_write(self, name, var):
+        """
+        Actualiza la copia en Python de un campo cuando su StringVar cambia.
+
+        Args:
+            name (str): La clave del campo en `self._field_values`.
+            var (tk.StringVar): La variable que se modificó.
+        """
+        self._field_values[name] = var.get()
+        self._parsed_fields.pop(name, None)
+
+    
+    def _parse_field(self, name):
+        """
+        Devuelve los elementos de un campo separado por comas, analizándolo solo si cambió.
+
+        Args:
+            name (str): La clave del campo en `self._field_values`.
+
+        Returns:
+            tuple[str]: Los elementos del campo, sin comas ni espacios.
+        """
+        tokens = self._parsed_fields.get(name)
+        if tokens is None:
+            tokens = self._parsed_fields[name] = tuple(_TOKEN_RE.findall(self._field_values[name]))
+        return tokens
+
+    
+    def _parse_transitions(self):
+        """
+        Devuelve las transiciones escritas en `transitions_text`, analizándolas solo si cambiaron.
+
+        Cada línea no vacía es una transición "origen simbolo destino": la expresión regular
+        recorre todo el texto de una vez y devuelve directamente las tuplas. Si el texto no
+        se modificó desde el último análisis, no se vuelve a copiar desde Tcl.
+
+        Returns:
+            tuple[tuple]: Las transiciones como tuplas (origen, simbolo, destino).
+
+        Raises:
+            ValueError: Si alguna línea no tiene exactamente tres campos.
+        """
+        if self._cached_transitions is None or self.transitions_text.edit_modified():
+            transitions_str = self.transitions_text.get("1.0", _END)
+            transitions = _TRANSITION_RE.findall(transitions_str)
+            if len(transitions) != len(_NONBLANK_LINE_RE.findall(transitions_str)):
+                raise ValueError("Cada transición debe tener el formato 'origen simbolo destino', una por línea.")
+            self._cached_transitions = tuple(transitions)
+            self.transitions_text.edit_modified(False)
+        return self._cached_transitions
+
+    
     def evaluate_chain(self):
         """
         Recopila la cadena de la GUI, llama a la lógica para su evaluación y formatea el resultado.
@@ -166,35 +391,26 @@ class AutomataGUI:
         evaluación y la `output_label` con el resultado final (aceptada o rechazada)
         y un mensaje descriptivo.
         """
-        chain = self.chain_entry.get().strip()
-        result, recorrido, message = self.automata_logic.evaluar_cadena(chain)
-        
-        self.evaluation_text.config(state='normal')
-        self.evaluation_text.delete('1.0', tk.END)
+        chain = self.chain_var.get().strip()
+        result, trace_lines, message = self.automata_logic.evaluar_cadena_con_traza(chain)
 
         # 1. Comprobación de estado no inicializado o error de ejecución irrecuperable
         if result is None or "Error" in message or "Proceso detenido" in message:
+            self.evaluation_text.delete('1.0', _END)
             self.output_label.config(text=message, foreground="red")
-            self.evaluation_text.config(state='disabled')
             return
 
-        self.evaluation_text.insert(tk.END, f"Evaluando la cadena: \"{chain}\"\n")
-        
-        # Muestra el recorrido de la simulación
-        if chain == '*':
-            self.evaluation_text.insert(tk.END, "1. La cadena es vacía. El recorrido no tiene transiciones.\n")
-        else:
-            for i, (estado, simbolo) in enumerate(recorrido):
-                if i == 0:
-                    self.evaluation_text.insert(tk.END, f"1. Iniciando en el estado ({estado}).\n")
-                else:
-                    estado_anterior = recorrido[i-1][0]
-                    self.evaluation_text.insert(tk.END, f"{i}. Desde el estado ({estado_anterior}) con el símbolo '{simbolo}' se transita al estado ({estado}).\n")
+        # Se arma todo el texto (encabezado, recorrido y resultado) en Python y se inserta
+        # de una vez: una sola llamada a Tcl sin importar la longitud de la cadena.
+        # Las líneas del recorrido ya vienen redactadas desde la capa lógica.
+        lineas = [f"Evaluando la cadena: \"{chain}\""]
+        lineas.extend(trace_lines)
         
         # Muestra el resultado final en el cuadro de recorrido
-        self.evaluation_text.insert(tk.END, "\nProceso finalizado.\n")
-        self.evaluation_text.insert(tk.END, f"Resultado: La cadena \"{chain}\" es {result}.\n")
-        self.evaluation_text.insert(tk.END, f"Mensaje: {message}\n")
+        lineas.append("\nProceso finalizado.")
+        lineas.append(f"Resultado: La cadena \"{chain}\" es {result}.")
+        lineas.append(f"Mensaje: {message}\n")
+        self.evaluation_text.replace('1.0', _END, "\n".join(lineas))
         
         # 2. Actualiza la etiqueta de salida (output_label) con el resultado y color
         if result == "ACEPTADA":
@@ -202,21 +418,85 @@ class AutomataGUI:
         else:
             # Si el resultado es RECHAZADA, muestra el resultado en rojo.
             self.output_label.config(text=message, foreground="red")
-            
-        self.evaluation_text.config(state='disabled')
+
+    
+    def _block_text_edit(self, event):
+        """
+        Impide que el usuario modifique `evaluation_text` desde el teclado.
+
+        El widget se deja siempre en estado 'normal' (así el programa puede escribir en él
+        sin alternar su estado) y esta función descarta las teclas que editarían el texto.
+        Se permiten el desplazamiento, la selección, Ctrl+C (copiar) y Ctrl+A (según la
+        plataforma, seleccionar todo o ir al inicio de la línea). Tab y Shift+Tab (también
+        con Ctrl) mueven el foco al widget siguiente o anterior, como en un widget deshabilitado.
+
+        Args:
+            event (tk.Event): El evento de teclado.
+
+        Returns:
+            str or None: "break" para descartar el evento, o None para procesarlo.
+        """
+        if event.keysym in _READ_ONLY_ALLOWED_KEYS:
+            return None
+        if event.keysym in ("Tab", "ISO_Left_Tab"):
+            if event.keysym == "ISO_Left_Tab" or event.state & _SHIFT_MASK:
+                event.widget.tk_focusPrev().focus_set()
+            else:
+                event.widget.tk_focusNext().focus_set()
+            return "break"
+        if event.state & _CONTROL_MASK and event.keysym.lower() in ("c", "a"):
+            return None
+        return "break"
 
     
     def generate_chains(self):
         """
-        Llama al método de la lógica para generar cadenas válidas y muestra el resultado en la etiqueta de salida.
+        Llama al método de la lógica para generar cadenas válidas y las muestra en `chains_listbox`.
 
         El resultado es una lista de cadenas que son aceptadas por el autómata definido.
+        La búsqueda se ejecuta en el hilo auxiliar y lee el autómata mientras tanto, así
+        que hasta que termina se deshabilitan los botones que lo reemplazan (definir y
+        cargar) y el propio botón, para no encolar búsquedas repetidas.
         """
-        message = self.automata_logic.generar_cadenas()
-        if "Define un autómata" in message:
-            self.output_label.config(text=message, foreground="red")
-        else:
-            self.output_label.config(text=message, foreground="blue")
+        buttons = (self.generate_button, self.define_button, self.load_button)
+        self._set_buttons_enabled(buttons, False)
+        self.output_label.config(text="Generando cadenas...", foreground="black")
+        self._run_in_background(
+            self._show_generated,
+            self.automata_logic.generar_cadenas,
+            on_finish=lambda: self._set_buttons_enabled(buttons, True),
+        )
+
+    
+    @staticmethod
+    def _set_buttons_enabled(buttons, enabled):
+        """
+        Habilita o deshabilita un grupo de botones.
+
+        Args:
+            buttons (tuple[ttk.Button]): Los botones a modificar.
+            enabled (bool): True para habilitarlos, False para deshabilitarlos.
+        """
+        state = ["!disabled"] if enabled else ["disabled"]
+        for button in buttons:
+            button.state(state)
+
+    
+    def _show_generated(self, chains):
+        """
+        Muestra en `chains_listbox` el resultado de `AutomataLogic.generar_cadenas`.
+
+        Args:
+            chains (list[str] or None): Las cadenas generadas, o None si no hay autómata definido.
+        """
+        self.chains_listbox.delete(0, _END)
+        if chains is None:
+            self.output_label.config(text="Define un autómata primero.", foreground="red")
+            return
+
+        # Todas las cadenas se insertan con una única llamada a Tcl.
+        self.chains_listbox.insert(_END, *chains)
+        self.output_label.config(text=f"Cadenas Válidas: {len(chains)} encontradas.", foreground="blue")
 
     
     def save_automata(self):
@@ -226,10 +506,25 @@ class AutomataGUI:
         El usuario selecciona una ubicación y un nombre de archivo. El autómata actual
         se guarda en formato JSON.
         """
-        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json", filetypes=self._JSON_FILETYPES, initialdir=self._last_dir
+        )
         if file_path:
-            message = self.automata_logic.guardar_automata(file_path)
-            self.output_label.config(text=message, foreground="green")
+            self._last_dir = os.path.dirname(file_path)
+            # La copia del autómata se toma aquí, en el hilo de Tk, para que una definición
+            # o una carga posterior no se mezcle con lo que se está escribiendo; en el hilo
+            # auxiliar solo se serializa y se escribe.
+            success, data = self.automata_logic.datos_automata()
+            if not success:
+                self.output_label.config(text=data, foreground="red")
+                return
+            self.output_label.config(text="Guardando...", foreground="black")
+            self._run_in_background(
+                lambda message: self.output_label.config(text=message, foreground="green"),
+                self.automata_logic.escribir_automata,
+                data,
+                file_path,
+            )
 
     
     def load_automata(self):
@@ -240,42 +535,72 @@ class AutomataGUI:
 
         Muestra un mensaje de éxito o error según el resultado.
         """
-        file_path = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+        file_path = filedialog.askopenfilename(filetypes=self._JSON_FILETYPES, initialdir=self._last_dir)
         if file_path:
-            # Recibe el mensaje de estado y los datos cargados (si es exitoso)
-            message, loaded_data = self.automata_logic.cargar_automata(file_path)
+            self._last_dir = os.path.dirname(file_path)
+            self.output_label.config(text="Cargando...", foreground="black")
+            # Solo la lectura del archivo se hace en el hilo auxiliar; el autómata se
+            # reemplaza después en el hilo de Tk, donde también se evalúa y se define.
+            # Mientras tanto no se puede iniciar una generación, que quedaría en curso en
+            # el hilo auxiliar justo cuando el autómata se reemplaza.
+            buttons = (self.generate_button, self.load_button)
+            self._set_buttons_enabled(buttons, False)
+            self._run_in_background(
+                self._on_automata_read,
+                self.automata_logic.leer_automata,
+                file_path,
+                on_finish=lambda: self._set_buttons_enabled(buttons, True),
+            )
+
+    
+    def _on_automata_read(self, result):
+        """
+        Aplica al modelo los datos leídos por `AutomataLogic.leer_automata` y actualiza la GUI.
+
+        Args:
+            result (tuple): (bool, datos o mensaje de error) devuelto por la lectura.
+        """
+        success, data = result
+        if success:
+            self._on_automata_loaded(self.automata_logic.aplicar_automata(data))
+        else:
+            self._on_automata_loaded((data, None))
+
+    
+    def _on_automata_loaded(self, result):
+        """
+        Actualiza los campos de la GUI con el resultado de `AutomataLogic.cargar_automata`.
+
+        Args:
+            result (tuple): El mensaje de estado y los datos cargados (o None si hubo error).
+        """
+        # Recibe el mensaje de estado y los datos cargados (si es exitoso)
+        message, loaded_data = result
+        # Comprobación de éxito: solo si el mensaje es el de éxito Y se recibieron datos.
+        if message == "Autómata cargado." and loaded_data:
             
-            # Comprobación de éxito: solo si el mensaje es el de éxito Y se recibieron datos.
-            if message == "Autómata cargado." and loaded_data:
-                
-                # --- LIMPIAR E INSERTAR DATOS ---
-                
-                # 1. Limpiar todos los campos
-                self.states_entry.delete(0, tk.END)
-                self.alphabet_entry.delete(0, tk.END)
-                self.initial_state_entry.delete(0, tk.END)
-                self.acceptance_states_entry.delete(0, tk.END)
-                self.transitions_text.delete("1.0", tk.END)
-                
-                # 2. Insertar los datos del diccionario cargado
-                self.states_entry.insert(0, ", ".join(loaded_data['estados']))
-                self.alphabet_entry.insert(0, ", ".join(loaded_data['alfabeto']))
-                self.initial_state_entry.insert(0, loaded_data['estado_inicial'])
-                self.acceptance_states_entry.insert(0, ", ".join(loaded_data['estados_aceptacion']))
-                
-                # 3. Formatear las transiciones para el widget Text
-                transitions_lines = []
-                for origen, transiciones in loaded_data['transiciones'].items():
-                    for simbolo, destino in transiciones.items():
-                        transitions_lines.append(f"{origen} {simbolo} {destino}")
-                
-                self.transitions_text.insert(tk.END, "\n".join(transitions_lines))
-                
-                # 4. Mostrar mensaje de éxito
-                self.output_label.config(text=message, foreground="green")
-            else:
-                # Mostrar mensaje de error (incluido si el archivo está mal o no existe)
-                self.output_label.config(text=message, foreground="red")
+            # --- LIMPIAR E INSERTAR DATOS ---
+            
+            # 1. Reemplazar el contenido de los campos (cada set sustituye el texto anterior)
+            self.states_var.set(", ".join(loaded_data['estados']))
+            self.alphabet_var.set(", ".join(loaded_data['alfabeto']))
+            self.initial_state_var.set(loaded_data['estado_inicial'])
+            self.acceptance_states_var.set(", ".join(loaded_data['estados_aceptacion']))
+            
+            # 2. Formatear las transiciones para el widget Text (un solo join, una sola inserción).
+            #    Text no admite StringVar, así que su contenido se reemplaza directamente.
+            transitions_str = "\n".join(
+                f"{origen} {simbolo} {destino}"
+                for origen, transiciones in loaded_data['transiciones'].items()
+                for simbolo, destino in transiciones.items()
+            )
+            self.transitions_text.replace("1.0", _END, transitions_str)
+            
+            # 3. Mostrar mensaje de éxito
+            self.output_label.config(text=message, foreground="green")
+        else:
+            # Mostrar mensaje de error (incluido si el archivo está mal o no existe)
+            self.output_label.config(text=message, foreground="red")
 
     
     def load_example_automata(self):
@@ -283,14 +608,30 @@ class AutomataGUI:
         Carga un autómata de ejemplo predefinido en los campos de la GUI.
 
         Este método se llama al iniciar la aplicación para que el usuario tenga un
-        ejemplo funcional con el que interactuar inmediatamente.
-        """
-        self.states_entry.insert(0, "q0, q1, q2")
-        self.alphabet_entry.insert(0, "a, b")
-        self.initial_state_entry.insert(0, "q0")
-        self.acceptance_states_entry.insert(0, "q0, q2")
-        self.transitions_text.insert(tk.END, "q0 a q1\nq0 b q0\nq1 a q1\nq1 b q2\nq2 a q2\nq2 b q2")
-        self.define_automata_from_gui()
+        ejemplo funcional con el que interactuar inmediatamente. Como los datos ya se
+        conocen, el autómata se define directamente con ellos, sin volver a leer y
+        analizar el contenido de los campos.
+        """
+        # 1. Definir el autómata a partir de los datos ya estructurados
+        message = self.automata_logic.definir_automata(
+            _EXAMPLE_STATES, _EXAMPLE_ALPHABET, _EXAMPLE_INITIAL, _EXAMPLE_ACCEPTANCE, _EXAMPLE_TRANSITIONS
+        )
+
+        # 2. Mostrar el ejemplo en los campos para que el usuario pueda verlo y editarlo
+        self.states_var.set(_EXAMPLE_TEXT["states"])
+        self.alphabet_var.set(_EXAMPLE_TEXT["alphabet"])
+        self.initial_state_var.set(_EXAMPLE_INITIAL)
+        self.acceptance_states_var.set(_EXAMPLE_TEXT["acceptance"])
+        self.transitions_text.replace("1.0", _END, _EXAMPLE_TEXT["transitions"])
+
+        # 3. Los campos ya corresponden al autómata definido: se registran como analizados
+        #    para que un "Definir Autómata" sin cambios no vuelva a leerlos ni analizarlos.
+        self._parsed_fields.update(
+            states=_EXAMPLE_STATES, alphabet=_EXAMPLE_ALPHABET, acceptance_states=_EXAMPLE_ACCEPTANCE
+        )
+        self._cached_transitions = _EXAMPLE_TRANSITIONS
+        self.transitions_text.edit_modified(False)
+        self.output_label.config(text=message, foreground="green")
 
 if __name__ == '__main__':
     # Punto de entrada principal de la aplicación GUI